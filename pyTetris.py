@@ -20,6 +20,28 @@ GAME_HEIGHT = ROWS * CELL_SIZE
 SIDEBAR_WIDTH = 200  # Width of the information sidebar
 WINDOW_WIDTH = GAME_WIDTH + SIDEBAR_WIDTH
 WINDOW_HEIGHT = GAME_HEIGHT
+LINE_SCORES = (0, 100, 300, 500, 800)  # Base points by number of lines cleared
+
+# === Bitboard Layout ===
+# The board is one int: row r occupies bits r*COLUMNS .. r*COLUMNS+COLUMNS-1
+LANE_BIT0 = sum(1 << (r * COLUMNS) for r in range(ROWS))       # Lowest bit of every row
+COLUMN_MASKS = tuple(LANE_BIT0 << c for c in range(COLUMNS))  # Every cell of each column
+
+def _full_row_shifts():
+    """
+    Shift amounts that AND each row's bits down into its lowest bit
+    After applying x &= x >> s for each shift, bit 0 of a row is set
+    only if all COLUMNS bits of that row were set.
+    """
+    shifts = []
+    span = 1
+    while span < COLUMNS:
+        step = min(span, COLUMNS - span)
+        shifts.append(step)
+        span += step
+    return tuple(shifts)
+
+FULL_ROW_SHIFTS = _full_row_shifts()
 
 # === Color Definitions ===
 BLACK = (0, 0, 0)
@@ -44,6 +66,7 @@ SHAPES = {
     'S': [[0, 1, 1], [1, 1, 0]],
     'Z': [[1, 1, 0], [0, 1, 1]]
 }
+SHAPE_KEYS = tuple(SHAPES)  # Piece type identifiers
 
 COLORS = {
     # Maps piece types to their display colors
@@ -56,43 +79,150 @@ COLORS = {
     'Z': RED
 }
 
+# Grid cells hold small color IDs: 0 is an empty cell, 1-7 index the piece colors
+PALETTE = [GRAY] + [COLORS[s] for s in SHAPE_KEYS]
+COLOR_ID = {s: i for i, s in enumerate(SHAPE_KEYS, 1)}
+
+def _rotate_matrix(shape):
+    """Rotate a 2D matrix 90 degrees clockwise"""
+    return tuple(tuple(shape[y][x]
+                       for y in range(len(shape)-1, -1, -1))
+                 for x in range(len(shape[0])))
+
+def _build_rotations(shape):
+    """Generate all 4 rotational states of a piece using matrix rotation"""
+    rotations = [tuple(tuple(row) for row in shape)]
+    # Generate 3 additional rotations (90°, 180°, 270°)
+    for _ in range(3):
+        rotations.append(_rotate_matrix(rotations[-1]))
+    return tuple(rotations)
+
+def _shape_mask(shape):
+    """
+    Convert a shape matrix into a board-layout bitmask
+    Returns:
+        tuple: (bits, width, height) where bits has the same row layout
+        as the board, anchored at row 0 / column 0
+    """
+    bits = sum(1 << (r * COLUMNS + c)
+               for r, row in enumerate(shape)
+               for c, v in enumerate(row) if v)
+    return bits, len(shape[0]), len(shape)
+
+def _bottom_profile(shape):
+    """Lowest occupied row index in each column of a shape matrix"""
+    return tuple(max(r for r, row in enumerate(shape) if row[c])
+                 for c in range(len(shape[0])))
+
+# Every rotation state of every piece, computed once at import
+ROTATIONS = {s: _build_rotations(m) for s, m in SHAPES.items()}
+ROT_MASKS = {s: tuple(_shape_mask(rot) for rot in rots)
+             for s, rots in ROTATIONS.items()}
+ROT_PROFILES = {s: tuple(_bottom_profile(rot) for rot in rots)
+                for s, rots in ROTATIONS.items()}
+ROT_CELLS = {s: tuple(tuple((r, c) for r, row in enumerate(rot)  # Occupied (row, col) offsets
+                            for c, v in enumerate(row) if v)
+                      for rot in rots)
+             for s, rots in ROTATIONS.items()}
+
+# === Bitboard Kernels ===
+# Pure functions on the packed board; Tetris wraps these with game state
+def _valid(board, masks, x, y):
+    """
+    Check if a piece fits on the board
+    Args:
+        board: Packed board bits
+        masks: (bits, width, height) of the piece rotation
+        x, y: Target grid position of the piece's top-left corner
+    Returns:
+        bool: True if the piece is in bounds and overlaps no blocks
+    """
+    bits, width, height = masks
+    # Check for:
+    # - Horizontal boundaries
+    # - Vertical bottom boundary
+    if x < 0 or x + width > COLUMNS or y + height > ROWS:
+        return False
+    # - Collision with existing blocks (rows above the grid never collide)
+    shift = y * COLUMNS + x
+    if shift >= 0:
+        bits <<= shift
+    else:
+        bits >>= -shift
+    return not bits & board
+
+def _lock(board, masks, x, y):
+    """Return the board with a piece's cells set at grid position (x, y)"""
+    return board | (masks[0] << (y * COLUMNS + x))
+
+def _clear_full_rows(board):
+    """
+    Remove every full row from the board
+    Returns:
+        tuple: (new_board, cleared) where cleared lists the removed row
+        indices from top to bottom
+    """
+    # Fold every row onto its lowest bit so all full rows are found at once
+    full = board
+    for shift in FULL_ROW_SHIFTS:
+        full &= full >> shift
+    full &= LANE_BIT0
+
+    cleared = []
+    # Remove full rows top to bottom so lower row indices stay valid
+    while full:
+        low = full & -full
+        row = (low.bit_length() - 1) // COLUMNS
+        below_mask = -1 << ((row + 1) * COLUMNS)
+        above_mask = (1 << (row * COLUMNS)) - 1
+        # Shift the rows above down by one, leaving an empty row at top
+        board = (board & below_mask) | ((board & above_mask) << COLUMNS)
+        cleared.append(row)
+        full ^= low
+    return board, cleared
+
 class Tetromino:
     """Represents a single tetromino piece with rotation capabilities"""
     def __init__(self, x, y, shape):
         self.x = x              # Grid x-position (left edge)
         self.y = y              # Grid y-position (top edge)
         self.shape = shape      # Piece type identifier
-        self.color = COLORS[shape]
+        self.color_id = COLOR_ID[shape]  # Index into PALETTE / CELL_SURFS
         self.rotation = 0       # Current rotation index (0-3)
-        self.shapes = self._get_rotations(SHAPES[shape])  # All rotation states
+        self.shapes = ROTATIONS[shape]   # All rotation states (shared, immutable)
         self.current_shape = self.shapes[self.rotation]   # Active rotation state
+        self.masks = ROT_MASKS[shape]    # Bitmasks per rotation (shared, immutable)
+        self.current_masks = self.masks[self.rotation]    # Active rotation bitmasks
+        self.profiles = ROT_PROFILES[shape]  # Bottom row per column, per rotation
+        self.current_profile = self.profiles[self.rotation]
+        self.all_cells = ROT_CELLS[shape]    # Occupied cell offsets per rotation
+        self.cells = self.all_cells[self.rotation]
+        self.height = len(self.current_shape)     # Active rotation size in cells
+        self.width = len(self.current_shape[0])
 
-    def _get_rotations(self, shape):
-        """Generate all 4 rotational states of a piece using matrix rotation"""
-        rotations = [shape]
-        last_rotation = shape
-        # Generate 3 additional rotations (90°, 180°, 270°)
-        for _ in range(3):
-            new_rotation = self._rotate_matrix(last_rotation)
-            rotations.append(new_rotation)
-            last_rotation = new_rotation
-        return rotations
-
-    def _rotate_matrix(self, shape):
-        """Rotate a 2D matrix 90 degrees clockwise"""
-        return [[shape[y][x] 
-                for y in range(len(shape)-1, -1, -1)]
-                for x in range(len(shape[0]))]
+    def set_rotation(self, rotation):
+        """Switch to the given rotation state"""
+        self.rotation = rotation
+        self.current_shape = self.shapes[rotation]
+        self.current_masks = self.masks[rotation]
+        self.current_profile = self.profiles[rotation]
+        self.cells = self.all_cells[rotation]
+        self.height = len(self.current_shape)
+        self.width = len(self.current_shape[0])
 
     def rotate(self):
         """Advance to next rotation state"""
-        self.rotation = (self.rotation + 1) % len(self.shapes)
-        self.current_shape = self.shapes[self.rotation]
+        self.set_rotation((self.rotation + 1) % len(self.shapes))
 
 class Tetris:
     """Main game controller handling game logic and state"""
     def __init__(self):
-        self.grid = [[0 for _ in range(COLUMNS)] for _ in range(ROWS)]  # Game board
+        self.board_bits = 0  # Bitboard of occupied cells (see Bitboard Layout)
+        self.grid = bytearray(ROWS * COLUMNS)  # Cell color IDs for drawing, row-major
+        self.play_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT)).convert()  # Cached board image
+        self.dirty = True         # Forces the first full paint of play_surface; lock and clear patch it in place
+        self.col_heights = [0] * COLUMNS  # Stack height of each column
+        self._bag = []            # Remaining piece types in the current 7-bag
         self.current_piece = self.new_piece()   # Active falling piece
         self.next_piece = self.new_piece()      # Preview piece
         self.score = 0                          # Player score
@@ -100,10 +230,17 @@ class Tetris:
         self.fall_speed = 1000   # Time between automatic drops (milliseconds)
         self.last_fall = pygame.time.get_ticks()  # Timer for automatic drops
         self.game_over = False    # Game state flag
+        self._score_surf = None   # Cached "Score:" text, rendered for _score_val
+        self._score_val = None
+        self._level_surf = None   # Cached "Level:" text, rendered for _level_val
+        self._level_val = None
 
     def new_piece(self):
-        """Create a new random tetromino piece"""
-        shape = random.choice(list(SHAPES.keys()))
+        """Create a new random tetromino piece using the 7-bag randomizer"""
+        if not self._bag:
+            # Refill with one of each piece type in random order
+            self._bag = random.sample(SHAPE_KEYS, len(SHAPE_KEYS))
+        shape = self._bag.pop()
         # Center the piece horizontally (approximate for all shapes)
         return Tetromino(COLUMNS // 2 - 2, 0, shape)
 
@@ -117,33 +254,29 @@ class Tetris:
         Returns:
             bool: True if move is valid, False if collision occurs
         """
-        for row in range(len(piece.current_shape)):
-            for col in range(len(piece.current_shape[row])):
-                if piece.current_shape[row][col]:
-                    new_x = piece.x + x + col
-                    new_y = piece.y + y + row
-                    # Check for:
-                    # - Horizontal boundaries
-                    # - Vertical bottom boundary
-                    # - Collision with existing blocks
-                    if (new_x < 0 or new_x >= COLUMNS or
-                        new_y >= ROWS or
-                        (new_y >= 0 and self.grid[new_y][new_x])):
-                        return False
-        return True
+        return _valid(self.board_bits, piece.current_masks, piece.x + x, piece.y + y)
 
     def lock_piece(self):
         """Lock the current piece into the grid and check for game over"""
-        for row in range(len(self.current_piece.current_shape)):
-            for col in range(len(self.current_piece.current_shape[row])):
-                if self.current_piece.current_shape[row][col]:
-                    y = self.current_piece.y + row
-                    x = self.current_piece.x + col
-                    # Check if piece is locked above visible grid
-                    if y < 0:
-                        self.game_over = True
-                        return
-                    self.grid[y][x] = self.current_piece.color
+        piece = self.current_piece
+        px, py = piece.x, piece.y
+        # Check if piece is locked above visible grid
+        if py < 0:
+            self.game_over = True
+            return
+        self.board_bits = _lock(self.board_bits, piece.current_masks, px, py)
+        grid = self.grid
+        color_id = piece.color_id
+        sprite = CELL_SURFS[color_id]
+        blits = []
+        for row, col in piece.cells:
+            grid[(py + row) * COLUMNS + px + col] = color_id
+            blits.append((sprite, ((px + col) * CELL_SIZE, (py + row) * CELL_SIZE)))
+        # Paint only the locked cells into the cached board image
+        self.play_surface.blits(blits, False)
+        col_heights = self.col_heights
+        for col in range(px, px + piece.width):
+            col_heights[col] = self.column_height(col)
 
         # Handle line clearing and piece management
         lines_cleared = self.clear_lines()
@@ -153,14 +286,36 @@ class Tetris:
 
     def clear_lines(self):
         """Clear completed lines and return number of lines cleared"""
-        lines_cleared = 0
-        for row in range(ROWS):
-            if all(self.grid[row]):  # Check if entire row is filled
-                del self.grid[row]
-                # Add new empty row at top
-                self.grid.insert(0, [0 for _ in range(COLUMNS)])
-                lines_cleared += 1
-        return lines_cleared
+        self.board_bits, cleared = _clear_full_rows(self.board_bits)
+        if not cleared:
+            return 0
+
+        # Mirror the removal on the color grid: rebuild it in one pass from
+        # the empty rows plus every row that was kept
+        grid = self.grid
+        self.grid = bytearray(len(cleared) * COLUMNS) + b"".join(
+            grid[row * COLUMNS:(row + 1) * COLUMNS]
+            for row in range(ROWS) if row not in cleared)
+
+        self.col_heights = [self.column_height(col) for col in range(COLUMNS)]
+
+        # Scroll the cached board image down over each cleared row
+        for row in cleared:
+            self.play_surface.set_clip((0, 0, GAME_WIDTH, (row + 1) * CELL_SIZE))
+            self.play_surface.scroll(0, CELL_SIZE)
+        self.play_surface.set_clip(None)
+        # Restore the empty rows that scrolled in at the top
+        self.play_surface.blit(BACKGROUND, (0, 0),
+                               (0, 0, GAME_WIDTH, len(cleared) * CELL_SIZE))
+        return len(cleared)
+
+    def column_height(self, col):
+        """Height of the stack in a column (ROWS minus its topmost filled row)"""
+        column = self.board_bits & COLUMN_MASKS[col]
+        if not column:
+            return 0
+        # Lowest set bit is the topmost filled cell
+        return ROWS - ((column & -column).bit_length() - 1) // COLUMNS
 
     def update_score(self, lines):
         """
@@ -172,8 +327,9 @@ class Tetris:
         3 lines: 500 * level
         4 lines: 800 * level
         """
-        line_scores = {0: 0, 1: 100, 2: 300, 3: 500, 4: 800}
-        self.score += line_scores[lines] * self.level
+        if not lines:
+            return
+        self.score += LINE_SCORES[lines] * self.level
         # Level up every 1000 points
         if self.score // 1000 > self.level:
             self.level += 1
@@ -189,8 +345,21 @@ class Tetris:
 
     def hard_drop(self):
         """Instantly drop piece to lowest possible position"""
-        while self.valid_move(self.current_piece, 0, 1):
-            self.current_piece.y += 1
+        piece = self.current_piece
+        heights = self.col_heights[piece.x:piece.x + piece.width]
+        top = ROWS - 1 - piece.y  # Largest possible drop of the piece's top row
+        # Distance to the stack is the smallest gap under any of the piece's columns
+        drop = ROWS
+        for height, bottom in zip(heights, piece.current_profile):
+            gap = top - height - bottom
+            if gap < 0:
+                # Piece is tucked under an overhang; fall back to stepping down
+                while self.valid_move(piece, 0, 1):
+                    piece.y += 1
+                break
+            drop = min(drop, gap)
+        else:
+            piece.y += drop
         self.lock_piece()
 
     def move_horizontal(self, dx):
@@ -204,87 +373,158 @@ class Tetris:
         self.current_piece.rotate()
         # Revert rotation if it causes collision
         if not self.valid_move(self.current_piece, 0, 0):
-            self.current_piece.rotation = original_rotation
-            self.current_piece.current_shape = self.current_piece.shapes[self.current_piece.rotation]
+            self.current_piece.set_rotation(original_rotation)
+
+# === Cell Sprites ===
+CELL_SURFS = []  # Pre-rendered cell sprites, indexed by color ID
+CELL_POSITIONS = tuple((x * CELL_SIZE, y * CELL_SIZE)  # Screen position of each grid index
+                       for y in range(ROWS) for x in range(COLUMNS))
+
+def load_cell_surfaces():
+    """Pre-render one outlined cell sprite per color (needs a display mode)"""
+    CELL_SURFS.clear()
+    for color in PALETTE:
+        surf = pygame.Surface((CELL_SIZE, CELL_SIZE))
+        surf.fill(color)
+        pygame.draw.rect(surf, BLACK, surf.get_rect(), 1)  # Grid lines
+        CELL_SURFS.append(surf.convert())
+
+BACKGROUND = None  # Window image with the empty grid, built by load_background
+
+def load_background():
+    """Render the black window with the empty grid once (needs cell sprites)"""
+    global BACKGROUND
+    BACKGROUND = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    BACKGROUND.fill(BLACK)
+    BACKGROUND.blits([(CELL_SURFS[0], pos) for pos in CELL_POSITIONS], False)
+
+# === Input ===
+# Window events that mean the screen contents were lost and need a full repaint
+REPAINT_EVENTS = [pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED]
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN] + REPAINT_EVENTS  # Event types the game loop reacts to
+
+# === Text ===
+FONT = pygame.font.Font(None, 36)  # Sidebar font, built once
+NEXT_TEXT = FONT.render("Next:", True, WHITE)
+GAME_OVER_TEXT = pygame.font.Font(None, 72).render("GAME OVER", True, RED)
+GAME_OVER_POS = GAME_OVER_TEXT.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2)).topleft
 
 # === Drawing Functions ===
-def draw_grid(surface, grid):
-    """Draw the game grid with existing blocks"""
-    for y in range(ROWS):
-        for x in range(COLUMNS):
-            rect = pygame.Rect(x*CELL_SIZE, y*CELL_SIZE, CELL_SIZE, CELL_SIZE)
-            color = grid[y][x] if grid[y][x] else GRAY  # Use gray for empty cells
-            pygame.draw.rect(surface, color, rect)
-            pygame.draw.rect(surface, BLACK, rect, 1)  # Grid lines
+WINDOW_RECT = (0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)  # Dirty rect for a full repaint
+def draw_grid(surface, game):
+    """Draw the game grid with existing blocks from the cached board image"""
+    if game.dirty:
+        # Start from the empty grid and draw only the filled cells on top
+        game.play_surface.blit(BACKGROUND, (0, 0))
+        game.play_surface.blits([
+            (CELL_SURFS[color_id], pos)
+            for color_id, pos in zip(game.grid, CELL_POSITIONS)
+            if color_id
+        ], False)
+        game.dirty = False
+    surface.blit(game.play_surface, (0, 0))
 
 def draw_piece(surface, piece):
     """Draw the current falling piece"""
-    for y in range(len(piece.current_shape)):
-        for x in range(len(piece.current_shape[y])):
-            if piece.current_shape[y][x]:
-                rect = pygame.Rect(
-                    (piece.x + x) * CELL_SIZE,
-                    (piece.y + y) * CELL_SIZE,
-                    CELL_SIZE, CELL_SIZE
-                )
-                pygame.draw.rect(surface, piece.color, rect)
-                pygame.draw.rect(surface, BLACK, rect, 1)
-
-def draw_sidebar(surface, next_piece, score, level):
+    sprite = CELL_SURFS[piece.color_id]
+    surface.blits([
+        (sprite, ((piece.x + x) * CELL_SIZE, (piece.y + y) * CELL_SIZE))
+        for y, x in piece.cells
+    ], False)
+
+def piece_rect(piece):
+    """Screen rectangle covered by a piece's bounding box"""
+    return pygame.Rect(piece.x * CELL_SIZE, piece.y * CELL_SIZE,
+                       piece.width * CELL_SIZE, piece.height * CELL_SIZE)
+
+def draw_sidebar(surface, game):
     """Draw the right sidebar with game information"""
-    font = pygame.font.Font(None, 36)
-    
+    next_piece = game.next_piece
+
     # Next Piece Preview
-    text = font.render("Next:", True, WHITE)
-    surface.blit(text, (GAME_WIDTH + 10, 10))
+    surface.blit(NEXT_TEXT, (GAME_WIDTH + 10, 10))
     
     preview_x = GAME_WIDTH + 50
     preview_y = 50
     # Draw next piece preview
-    for y in range(len(next_piece.current_shape)):
-        for x in range(len(next_piece.current_shape[y])):
-            if next_piece.current_shape[y][x]:
-                rect = pygame.Rect(
-                    preview_x + x * CELL_SIZE,
-                    preview_y + y * CELL_SIZE,
-                    CELL_SIZE, CELL_SIZE
-                )
-                pygame.draw.rect(surface, next_piece.color, rect)
-                pygame.draw.rect(surface, BLACK, rect, 1)
+    sprite = CELL_SURFS[next_piece.color_id]
+    surface.blits([
+        (sprite, (preview_x + x * CELL_SIZE, preview_y + y * CELL_SIZE))
+        for y, x in next_piece.cells
+    ], False)
     
-    # Score Display
-    text = font.render(f"Score: {score}", True, WHITE)
-    surface.blit(text, (GAME_WIDTH + 10, 200))
+    # Score Display (re-rendered only when the score changes)
+    if game.score != game._score_val:
+        game._score_surf = FONT.render(f"Score: {game.score}", True, WHITE)
+        game._score_val = game.score
+    surface.blit(game._score_surf, (GAME_WIDTH + 10, 200))
     
-    # Level Display
-    text = font.render(f"Level: {level}", True, WHITE)
-    surface.blit(text, (GAME_WIDTH + 10, 250))
+    # Level Display (re-rendered only when the level changes)
+    if game.level != game._level_val:
+        game._level_surf = FONT.render(f"Level: {game.level}", True, WHITE)
+        game._level_val = game.level
+    surface.blit(game._level_surf, (GAME_WIDTH + 10, 250))
 
 def draw_game_over(surface):
     """Display game over screen"""
-    font = pygame.font.Font(None, 72)
-    text = font.render("GAME OVER", True, RED)
-    text_rect = text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
-    surface.blit(text, text_rect)
+    surface.blit(GAME_OVER_TEXT, GAME_OVER_POS)
+
+def draw_frame(surface, game, last_frame):
+    """
+    Redraw only what changed since the previous frame
+    Args:
+        surface: Display surface
+        game: Tetris game to draw
+        last_frame: Frame state returned by the previous call (None forces a full redraw)
+    Returns:
+        tuple: (frame state, list of dirty Rects for pygame.display.update)
+    """
+    piece = game.current_piece
+    board_key = (game, piece, game.game_over)  # Changes on lock, reset or game over
+    piece_key = (piece.x, piece.y, piece.rotation)
+    if last_frame is None or last_frame[0] != board_key:
+        # Board, sidebar or game state changed: repaint everything
+        surface.blit(BACKGROUND, (0, 0))
+        draw_grid(surface, game)
+        draw_piece(surface, piece)
+        draw_sidebar(surface, game)
+        if game.game_over:
+            draw_game_over(surface)
+        return (board_key, piece_key, piece_rect(piece)), [WINDOW_RECT]
+    if last_frame[1] == piece_key:
+        return last_frame, []
+    # Only the falling piece moved: restore the board under its old position
+    old_rect = last_frame[2]
+    surface.blit(game.play_surface, old_rect, old_rect)
+    draw_piece(surface, piece)
+    new_rect = piece_rect(piece)
+    return (board_key, piece_key, new_rect), [old_rect, new_rect]
 
 def main():
     """Main game loop and initialization"""
     # Initialize display
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("Tetris")
-    clock = pygame.time.Clock()
+    load_cell_surfaces()
+    load_background()
+    # Only queue the event types the game handles
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(HANDLED_EVENTS)
     game = Tetris()
+    frame = None  # What is currently on screen, see draw_frame
+    waited = []   # Event that ended the last sleep, handled first
 
     # Game loop
     while True:
-        screen.fill(BLACK)
         current_time = pygame.time.get_ticks()
         
         # Event Handling
-        for event in pygame.event.get():
+        for event in waited + pygame.event.get(HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 return
+            if event.type in REPAINT_EVENTS:
+                frame = None  # Window was exposed or restored: redraw everything
             if event.type == pygame.KEYDOWN:
                 if game.game_over:
                     # Reset game on any key press after game over
@@ -308,15 +548,18 @@ def main():
             game.last_fall = current_time
 
         # Rendering
-        draw_grid(screen, game.grid)
-        draw_piece(screen, game.current_piece)
-        draw_sidebar(screen, game.next_piece, game.score, game.level)
-        if game.game_over:
-            draw_game_over(screen)
+        frame, dirty_rects = draw_frame(screen, game, frame)
         
-        # Update display
-        pygame.display.flip()
-        clock.tick(60)  # Cap at 60 FPS
+        # Update display (only the regions that changed)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+
+        # Sleep until the next input event or the next automatic drop
+        if game.game_over:
+            timeout = 0  # Nothing falls; block until a key press
+        else:
+            timeout = max(1, game.last_fall + game.fall_speed + 1 - pygame.time.get_ticks())
+        waited = [pygame.event.wait(timeout)]  # NOEVENT if the timeout expired
 
 if __name__ == "__main__":
     main()